@@ -20,6 +20,7 @@ project:
 output:
   filename: "output_image.png"
   dpi: 300
+  compress_level: 1          # Optional: PNG zlib level 0-9 (higher = smaller, slower)
 
 tasks:
   - name: "Task Name"
@@ -37,23 +38,31 @@ Task Logic
 Dependencies
 ------------
 - matplotlib
+- numpy
 - pandas
-- PyYAML (install via `pip install pyyaml`)
+- PyYAML (install via `pip install pyyaml`; the wheels ship the libyaml C
+  bindings on most platforms, which are used for faster config parsing)
 """
 
 import os
 import sys
 import yaml
-import matplotlib.pyplot as plt
-import pandas as pd
-import matplotlib.dates as mdates
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import groupby
+
+# Prefer the libyaml-backed loader when available; fall back to pure Python.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 # ----------------------------
 # Defaults & Constants
 # ----------------------------
 CONFIG_FILE = "progress-tracking/gantt-chart/gantt_config.yaml"
 FIG_SIZE = (15, 6)
+NS_PER_WEEK = 7 * 86_400 * 1_000_000_000
 
 # Colors
 STYLE = {
@@ -70,6 +79,26 @@ STYLE = {
     "remaining_overlay_color": "#27AE60"  # Green overlay for remaining time
 }
 
+# Matplotlib rcParams for the chart (fonts, spines, ticks, grid)
+CHART_RC = {
+    "font.family": "sans-serif",
+    "font.sans-serif": ["Segoe UI", "Roboto", "Arial", "sans-serif"],
+    "axes.spines.top": False,
+    "axes.spines.right": False,
+    "axes.edgecolor": STYLE["grid_color"],
+    "axes.axisbelow": True,
+    "axes.grid": True,
+    "axes.grid.axis": "x",
+    "axes.grid.which": "major",
+    "grid.linestyle": "-",
+    "grid.alpha": 0.5,
+    "grid.color": STYLE["grid_color"],
+    "xtick.major.size": 5,
+    "xtick.minor.size": 0,
+    "xtick.color": STYLE["grid_color"],
+    "ytick.major.size": 0,
+}
+
 def load_config(config_path):
     """Loads and validates the YAML configuration."""
     if not os.path.exists(config_path):
@@ -79,17 +108,38 @@ def load_config(config_path):
     
     with open(config_path, 'r') as f:
         try:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_YamlLoader)
         except yaml.YAMLError as e:
             print(f"Error parsing YAML: {e}")
             sys.exit(1)
 
 def parse_date(date_str):
     """Helper to parse YYYY-MM-DD string to datetime."""
-    return datetime.strptime(str(date_str), "%Y-%m-%d")
+    return _parse_date_cached(str(date_str))
+
+@lru_cache(maxsize=256)
+def _parse_date_cached(date_str):
+    # Configs often repeat dates (project start, chained start dates), so skip re-running strptime
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
+def is_sequential(task):
+    """True if the task simply follows the previous one (no fixed start, numeric duration)."""
+    return not task.get("start_date") and task["duration_weeks"] != "start2end"
+
+def parse_weeks(task):
+    """Parses a task's numeric `duration_weeks`, exiting on invalid values."""
+    try:
+        return float(task["duration_weeks"])
+    except ValueError:
+        print(f"Error: Invalid duration '{task['duration_weeks']}' for task '{task['name']}'")
+        sys.exit(1)
 
 def calculate_schedule(config):
     """Calculates start and end dates for all tasks."""
+    # Heavy imports are deferred so config errors are reported without their startup cost
+    import numpy as np
+    import pandas as pd
+    
     project_start = parse_date(config["project"]["start_date"])
     project_end = parse_date(config["project"]["end_date"])
     
@@ -99,274 +149,274 @@ def calculate_schedule(config):
         print(f"WARNING: Project duration is {total_duration_days} days (> 15 months).")
         print("The Gantt chart might look crowded or weird. Consider shortening the timeline.")
     
-    tasks_data = []
+    names, starts, ends = [], [], []
     current_date = project_start
     
-    for task in config["tasks"]:
-        name = task["name"]
-        duration_val = task["duration_weeks"]
-        manual_start = task.get("start_date")
+    for sequential, run in groupby(config["tasks"], key=is_sequential):
+        run = list(run)
         
-        # Determine Start Date
-        if manual_start:
-            start_date = parse_date(manual_start)
-        else:
-            start_date = current_date
+        if sequential:
+            # Back-to-back tasks: accumulate durations in one vectorized pass,
+            # on int64 nanoseconds so the whole run stays in NumPy
+            weeks = np.array([parse_weeks(task) for task in run], dtype=np.float64)
+            start_ns = pd.Timestamp(current_date).value
+            run_ends = start_ns + np.cumsum(np.round(weeks * NS_PER_WEEK).astype(np.int64))
+            run_starts = np.concatenate(([start_ns], run_ends[:-1]))
             
-        # Determine End Date
-        if duration_val == "start2end":
+            names.extend(task["name"] for task in run)
+            starts.extend(run_starts.view("datetime64[ns]"))
+            ends.extend(run_ends.view("datetime64[ns]"))
+            current_date = pd.Timestamp(run_ends[-1])
+            continue
+        
+        for task in run:
+            duration_val = task["duration_weeks"]
+            manual_start = task.get("start_date")
+            
+            # Determine Start Date
             if manual_start:
                 start_date = parse_date(manual_start)
-                end_date = project_end
             else:
                 start_date = project_start
+                
+            # Determine End Date
+            if duration_val == "start2end":
                 end_date = project_end
-        else:
-            # Standard duration in weeks
-            try:
-                weeks = float(duration_val)
-                end_date = start_date + timedelta(weeks=weeks)
-            except ValueError:
-                 print(f"Error: Invalid duration '{duration_val}' for task '{name}'")
-                 sys.exit(1)
-        
-        # Update current_date for the *next* task
-        if duration_val != "start2end":
-             current_date = end_date
-             
-        tasks_data.append({
-            "Task": name,
-            "Start": start_date,
-            "End": end_date,
-            "DurationDays": (end_date - start_date).days
-        })
+            else:
+                # Standard duration in weeks
+                end_date = start_date + timedelta(weeks=parse_weeks(task))
+                # Update current_date for the *next* task
+                current_date = end_date
+                
+            names.append(task["name"])
+            starts.append(start_date)
+            ends.append(end_date)
+    
+    # Typed columns up front, so pandas doesn't have to infer dtypes or box each date
+    df = pd.DataFrame({
+        "Task": names,
+        "Start": np.array(starts, dtype="datetime64[ns]"),
+        "End": np.array(ends, dtype="datetime64[ns]"),
+    })
+    df["DurationDays"] = (df["End"] - df["Start"]).dt.days.to_numpy()
         
-    return pd.DataFrame(tasks_data), project_start, project_end
+    return df, project_start, project_end
+
+def month_starts_between(start, end):
+    """Returns the first day of every month from `start`'s month through `end`'s month."""
+    year, month = start.year, start.month
+    months = []
+    while (year, month) <= (end.year, end.month):
+        months.append(datetime(year, month, 1))
+        month += 1
+        if month == 13:
+            month = 1
+            year += 1
+    return months
 
 def create_gantt_chart(df, project_start, project_end, config):
     """Generates the matplotlib chart."""
+    import matplotlib
+    matplotlib.use("Agg")  # file output only; skip interactive backend probing
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
     
-    plt.rcParams['font.family'] = 'sans-serif'
-    plt.rcParams['font.sans-serif'] = ['Segoe UI', 'Roboto', 'Arial', 'sans-serif']
-    
-    fig, ax = plt.subplots(figsize=FIG_SIZE)
-    
-    # Border
-    fig.patch.set_edgecolor(STYLE["border_color"])
-    fig.patch.set_linewidth(2)
-    
-    # ----------------------------
-    # Draw Bars
-    # ----------------------------
-    y_pos = range(len(df))
-    
-    bars = ax.barh(
-        y_pos,
-        df["DurationDays"],
-        left=df["Start"],
-        height=config.get("project", {}).get("bar_height", 0.5),
-        align='center',
-        color=STYLE["bar_color"],
-        alpha=0.9,
-        edgecolor=STYLE["bar_edge_color"],
-        linewidth=1,
-        zorder=3
-    )
-    
-    # ----------------------------
-    # Annotations & Lines
-    # ----------------------------
-    plot_start_lim = datetime(project_start.year, project_start.month, 1)
-    plot_end_lim = project_end + timedelta(weeks=3)
-    
-    ax.set_xlim(left=plot_start_lim, right=plot_end_lim)
-    
-    # Resolve today date once from config
-    today = None
-    today_cfg = str(config.get("project", {}).get("today_date", "")).strip().lower()
-    if today_cfg == "today":
-        today = datetime.now()
-    elif today_cfg:
-        today = parse_date(config["project"]["today_date"])
-
-    for i, bar in enumerate(bars):
-        start = df.loc[i, "Start"]
-        end = df.loc[i, "End"]
+    # Styling is applied through rcParams as artists are created, not mutated afterwards
+    with plt.rc_context(CHART_RC):
+        fig, ax = plt.subplots(figsize=FIG_SIZE)
+        
+        # Border
+        fig.patch.set_edgecolor(STYLE["border_color"])
+        fig.patch.set_linewidth(2)
+        
+        # ----------------------------
+        # Draw Bars
+        # ----------------------------
+        y_pos = range(len(df))
+        
+        bars = ax.barh(
+            y_pos,
+            df["DurationDays"],
+            left=df["Start"],
+            height=config.get("project", {}).get("bar_height", 0.5),
+            align='center',
+            color=STYLE["bar_color"],
+            alpha=0.9,
+            edgecolor=STYLE["bar_edge_color"],
+            linewidth=1,
+            zorder=3
+        )
         
-        # Grid connection line
-        ax.hlines(y=i, xmin=plot_start_lim, xmax=start, 
+        # ----------------------------
+        # Annotations & Lines
+        # ----------------------------
+        plot_start_lim = datetime(project_start.year, project_start.month, 1)
+        plot_end_lim = project_end + timedelta(weeks=3)
+        
+        ax.set_xlim(left=plot_start_lim, right=plot_end_lim)
+        
+        # Resolve today date once from config
+        today = None
+        today_cfg = str(config.get("project", {}).get("today_date", "")).strip().lower()
+        if today_cfg == "today":
+            today = datetime.now()
+        elif today_cfg:
+            today = parse_date(config["project"]["today_date"])
+
+        # Grid connection lines (one collection for all tasks)
+        ax.hlines(y=y_pos, xmin=plot_start_lim, xmax=df["Start"],
                   color=STYLE["grid_color"], linestyle=':', linewidth=1, zorder=2)
         
-        # Label text
-        date_str = f"{start.strftime('%d %b')} - {end.strftime('%d %b')}"
-        duration_days = (end - start).days
+        # Label text: resolve placement for every task first, then draw
+        bar_labels = []
+        for task in df.itertuples(index=False):
+            start = task.Start
+            end = task.End
+            date_str = f"{start.strftime('%d %b')} - {end.strftime('%d %b')}"
         
-        if duration_days > 40:
-            text_x = start + (end - start) / 2
-            ha = 'center'
-            color = 'white'
-            fw = 'bold'
-        else:
-            text_x = end + timedelta(days=3)
-            ha = 'left'
-            color = STYLE["text_color"]
-            fw = 'normal'
-            
-        ax.text(text_x, i, date_str, ha=ha, va='center', 
-                color=color, fontsize=9, fontweight=fw, zorder=4)
+            if task.DurationDays > 40:
+                bar_labels.append((start + (end - start) / 2, date_str, 'center', 'white', 'bold'))
+            else:
+                bar_labels.append((end + timedelta(days=3), date_str, 'left', STYLE["text_color"], 'normal'))
+        
+        for i, (text_x, date_str, ha, color, fw) in enumerate(bar_labels):
+            ax.text(text_x, i, date_str, ha=ha, va='center', 
+                    color=color, fontsize=9, fontweight=fw, zorder=4)
 
-    # ----------------------------
-    # Axis & Grid
-    # ----------------------------
-    ax.set_yticks(y_pos)
-    ax.set_yticklabels(df["Task"], fontsize=11, color=STYLE["text_color"], fontweight='500')
-    ax.invert_yaxis() 
-    
-    # Standard padding
-    ax.set_ylim(bottom=len(df)-0.5, top=-0.5)
-    
-    # X-Axis
-    ax.xaxis.set_major_locator(mdates.MonthLocator())
-    ax.xaxis.set_major_formatter(plt.NullFormatter()) 
-    
-    month_range = pd.date_range(start=plot_start_lim, end=plot_end_lim, freq='MS')
-    midpoints = []
-    labels = []
-    
-    # Heuristic: If we have many months, use short names to avoid overlap
-    use_short_names = len(month_range) > 10
-    
-    for i in range(len(month_range) - 1):
-        m_start = month_range[i]
-        m_end = month_range[i+1]
+        # ----------------------------
+        # Axis & Grid
+        # ----------------------------
+        ax.set_yticks(y_pos)
+        ax.set_yticklabels(df["Task"], fontsize=11, color=STYLE["text_color"], fontweight='500')
+        ax.invert_yaxis() 
+        
+        # Standard padding
+        ax.set_ylim(bottom=len(df)-0.5, top=-0.5)
         
-        bg_color = STYLE["bg_color_alt"] if i % 2 == 0 else "#FFFFFF"
-        ax.axvspan(m_start, m_end, facecolor=bg_color, alpha=1.0, zorder=0)
+        # X-Axis
+        ax.xaxis.set_major_locator(mdates.MonthLocator())
+        ax.xaxis.set_major_formatter(plt.NullFormatter()) 
         
-        midpoints.append(m_start + (m_end - m_start) / 2)
+        month_range = month_starts_between(plot_start_lim, plot_end_lim)
+        month_starts = month_range[:-1]
+        month_ends = month_range[1:]
         
-        if use_short_names:
-            # Short: "Jan '26"
-            labels.append(m_start.strftime("%b '%y"))
-        else:
-            # Long: "January '26"
-            labels.append(m_start.strftime("%B '%y"))
+        for i, (m_start, m_end) in enumerate(zip(month_starts, month_ends)):
+            bg_color = STYLE["bg_color_alt"] if i % 2 == 0 else "#FFFFFF"
+            ax.axvspan(m_start, m_end, facecolor=bg_color, alpha=1.0, zorder=0)
         
-    elapsed_overlay = config.get("project", {}).get("show_elapsed_overlay", True)
-    # Elapsed-time overlay (red translucent): project start -> today
-    if today is not None and elapsed_overlay is True:
-        elapsed_start = max(project_start, plot_start_lim)
-        elapsed_end = min(today, project_end, plot_end_lim)
-        if elapsed_start < elapsed_end:
-            ax.axvspan(
-                elapsed_start,
-                elapsed_end,
-                facecolor=STYLE["elapsed_overlay_color"],
-                alpha=0.22,   # increase visibility
-                zorder=2.6    # above background, below bars/text
-            )
+        midpoints = [m_start + (m_end - m_start) / 2 for m_start, m_end in zip(month_starts, month_ends)]
+        
+        # Heuristic: If we have many months, use short names to avoid overlap
+        # Short: "Jan '26", Long: "January '26"
+        month_fmt = "%b '%y" if len(month_range) > 10 else "%B '%y"
+        labels = [m_start.strftime(month_fmt) for m_start in month_starts]
+        
+        elapsed_overlay = config.get("project", {}).get("show_elapsed_overlay", True)
+        # Elapsed-time overlay (red translucent): project start -> today
+        if today is not None and elapsed_overlay is True:
+            elapsed_start = max(project_start, plot_start_lim)
+            elapsed_end = min(today, project_end, plot_end_lim)
+            if elapsed_start < elapsed_end:
+                ax.axvspan(
+                    elapsed_start,
+                    elapsed_end,
+                    facecolor=STYLE["elapsed_overlay_color"],
+                    alpha=0.22,   # increase visibility
+                    zorder=2.6    # above background, below bars/text
+                )
 
-    remaining_overlay = config.get("project", {}).get("show_remaining_overlay", True)
-    # Remaining-time overlay (green translucent): today -> project end
-    if today is not None and remaining_overlay is True:
-        remaining_start = max(today, project_start, plot_start_lim)
-        remaining_end = min(project_end, plot_end_lim)
-        if remaining_start < remaining_end:
-            ax.axvspan(
-                remaining_start,
-                remaining_end,
-                facecolor=STYLE["remaining_overlay_color"],
-                alpha=0.14,
-                zorder=2.5
-            )
+        remaining_overlay = config.get("project", {}).get("show_remaining_overlay", True)
+        # Remaining-time overlay (green translucent): today -> project end
+        if today is not None and remaining_overlay is True:
+            remaining_start = max(today, project_start, plot_start_lim)
+            remaining_end = min(project_end, plot_end_lim)
+            if remaining_start < remaining_end:
+                ax.axvspan(
+                    remaining_start,
+                    remaining_end,
+                    facecolor=STYLE["remaining_overlay_color"],
+                    alpha=0.14,
+                    zorder=2.5
+                )
 
-    ax.set_xticks(midpoints, minor=True)
-    ax.set_xticklabels(labels, minor=True, fontsize=11, 
-                       color=STYLE["text_color"], fontweight='bold')
-    
-    ax.tick_params(axis='x', which='minor', length=0)
-    ax.tick_params(axis='x', which='major', length=5, color=STYLE["grid_color"])
-    ax.tick_params(axis='y', length=0)
-    
-    ax.grid(axis='x', which='major', linestyle='-', alpha=0.5, 
-            color=STYLE["grid_color"], zorder=1)
-    ax.set_axisbelow(True)
-    
-    # Spines
-    for spine in ['top', 'right']:
-        ax.spines[spine].set_visible(False)
-    ax.spines['left'].set_visible(True)
-    ax.spines['left'].set_linewidth(2)
-    ax.spines['left'].set_color(STYLE["text_color"])
-    ax.spines['bottom'].set_color(STYLE["grid_color"])
-    
-    # ----------------------------
-    # Project Markers
-    # ----------------------------
-    ax.axvline(project_start, color=STYLE["success_color"], linestyle='--', 
-               linewidth=1.5, alpha=0.8, zorder=5)
-    ax.axvline(project_end, color=STYLE["highlight_color"], linestyle='--', 
-               linewidth=1.5, alpha=0.8, zorder=5)
-    
-    # Today's date marker
-    if today is not None and plot_start_lim <= today <= plot_end_lim:
-        ax.axvline(today, color=STYLE["today_color"], linestyle='-',
-                   linewidth=2, alpha=0.7, zorder=5)
-        today_label = today.strftime("%d-%b'%y")
-        ax.text(today, -0.06, f"Today: {today_label}",
-                color=STYLE["today_color"], ha='center', va='top',
-                transform=ax.get_xaxis_transform(), fontsize=9, fontweight='bold')
+        ax.set_xticks(midpoints, minor=True)
+        ax.set_xticklabels(labels, minor=True, fontsize=11, 
+                           color=STYLE["text_color"], fontweight='bold')
+        
+        # Only the left spine differs from the rc defaults in CHART_RC
+        ax.spines['left'].set_linewidth(2)
+        ax.spines['left'].set_color(STYLE["text_color"])
+        
+        # ----------------------------
+        # Project Markers
+        # ----------------------------
+        ax.axvline(project_start, color=STYLE["success_color"], linestyle='--', 
+                   linewidth=1.5, alpha=0.8, zorder=5)
+        ax.axvline(project_end, color=STYLE["highlight_color"], linestyle='--', 
+                   linewidth=1.5, alpha=0.8, zorder=5)
+        
+        # Today's date marker
+        if today is not None and plot_start_lim <= today <= plot_end_lim:
+            ax.axvline(today, color=STYLE["today_color"], linestyle='-',
+                       linewidth=2, alpha=0.7, zorder=5)
+            today_label = today.strftime("%d-%b'%y")
+            ax.text(today, -0.06, f"Today: {today_label}",
+                    color=STYLE["today_color"], ha='center', va='top',
+                    transform=ax.get_xaxis_transform(), fontsize=9, fontweight='bold')
 
-    # Bottom Date Labels (below X axis)
-    ax.text(project_start, -0.06, project_start.strftime("%d-%b'%y"), 
-            color=STYLE["success_color"], ha='center', va='top', 
-            transform=ax.get_xaxis_transform(), fontsize=10, fontweight='bold')
-    ax.text(project_end, -0.06, project_end.strftime("%d-%b'%y"), 
-            color=STYLE["highlight_color"], ha='center', va='top', 
-            transform=ax.get_xaxis_transform(), fontsize=10, fontweight='bold')
-    
-    # ----------------------------
-    # Milestones
-    # ----------------------------
-    milestones_cfg = config.get("milestones", {})
-    if milestones_cfg.get("show_milestones", True):
-        milestone_color = "#800000" # Maroon
-        milestones = milestones_cfg.get("items", [])
+        # Bottom Date Labels (below X axis)
+        ax.text(project_start, -0.06, project_start.strftime("%d-%b'%y"), 
+                color=STYLE["success_color"], ha='center', va='top', 
+                transform=ax.get_xaxis_transform(), fontsize=10, fontweight='bold')
+        ax.text(project_end, -0.06, project_end.strftime("%d-%b'%y"), 
+                color=STYLE["highlight_color"], ha='center', va='top', 
+                transform=ax.get_xaxis_transform(), fontsize=10, fontweight='bold')
         
-        for ms in milestones:
-            ms_date = parse_date(ms["date"])
-            ms_name = ms["name"]
-            
-            if plot_start_lim <= ms_date <= plot_end_lim:
-                # Vertical line
-                ax.axvline(ms_date, color=milestone_color, linestyle='--', 
-                           linewidth=1, alpha=0.4, zorder=1)
-                
-                # Diamond marker slightly above the top spine
-                # Using axis transform for Y to stick to the top (y=1.01)
-                ax.plot(ms_date, 1.01, marker='d', markersize=8, 
-                        color=milestone_color, alpha=1.0, zorder=11,
-                        transform=ax.get_xaxis_transform(), clip_on=False)
-                
-                # Label above the diamond
-                ax.text(ms_date, 1.03, ms_name, 
-                        color=milestone_color, ha='left', va='bottom', 
-                        transform=ax.get_xaxis_transform(),
-                        fontsize=9, fontweight='bold', zorder=10, rotation=35)
+        # ----------------------------
+        # Milestones
+        # ----------------------------
+        milestones_cfg = config.get("milestones", {})
+        if milestones_cfg.get("show_milestones", True):
+            milestone_color = "#800000" # Maroon
+            milestones = milestones_cfg.get("items", [])
+        
+            for ms in milestones:
+                ms_date = parse_date(ms["date"])
+                ms_name = ms["name"]
+        
+                if plot_start_lim <= ms_date <= plot_end_lim:
+                    # Vertical line
+                    ax.axvline(ms_date, color=milestone_color, linestyle='--', 
+                               linewidth=1, alpha=0.4, zorder=1)
+        
+                    # Diamond marker slightly above the top spine
+                    # Using axis transform for Y to stick to the top (y=1.01)
+                    ax.plot(ms_date, 1.01, marker='d', markersize=8, 
+                            color=milestone_color, alpha=1.0, zorder=11,
+                            transform=ax.get_xaxis_transform(), clip_on=False)
+        
+                    # Label above the diamond
+                    ax.text(ms_date, 1.03, ms_name, 
+                            color=milestone_color, ha='left', va='bottom', 
+                            transform=ax.get_xaxis_transform(),
+                            fontsize=9, fontweight='bold', zorder=10, rotation=35)
 
-    # ----------------------------
-    # Title & Save
-    # ----------------------------
-    if config["project"].get("show_title", True):
-        ax.set_title(config["project"]["title"], fontsize=18, pad=40, 
-                    color=STYLE["text_color"], fontweight='bold', loc='center')
-    
-    plt.tight_layout()
-    
-    output_path = config["output"]["filename"]
-    
-    plt.savefig(output_path, dpi=config["output"].get("dpi", 300), bbox_inches="tight")
-    print(f"Chart saved successfully to: {output_path}")
+        # ----------------------------
+        # Title & Save
+        # ----------------------------
+        if config["project"].get("show_title", True):
+            ax.set_title(config["project"]["title"], fontsize=18, pad=40, 
+                        color=STYLE["text_color"], fontweight='bold', loc='center')
+        
+        plt.tight_layout()
+        
+        output_path = config["output"]["filename"]
+        
+        # Low zlib level: much faster PNG encode at high DPI for a slightly larger file
+        plt.savefig(output_path, dpi=config["output"].get("dpi", 300), bbox_inches="tight",
+                    pil_kwargs={"compress_level": config["output"].get("compress_level", 1)})
+        print(f"Chart saved successfully to: {output_path}")
 
 def main():
     print(f"Reading configuration from {CONFIG_FILE}...")
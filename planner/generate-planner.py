@@ -3,6 +3,7 @@ from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
 from reportlab.lib.units import mm
+from functools import lru_cache
 
 path = "./thesis_print_sheets_A4.pdf"
 
@@ -28,31 +29,46 @@ def vspace(h=8):
 def header(text):
     elements.append(Paragraph(f"<b>{text}</b>", styles["H"]))
 
+# usable table width on an A4 page
+_USABLE_WIDTH = A4[0] - 60
+
+# shared across all grids: style is identical, and empty cell blocks only depend on shape
+_GRID_STYLE = TableStyle([
+    ("GRID", (0,0), (-1,-1), 0.7, colors.black),
+    ("VALIGN", (0,0), (-1,-1), "TOP"),
+    ("LEFTPADDING", (0,0), (-1,-1), 4),
+    ("RIGHTPADDING", (0,0), (-1,-1), 4),
+    ("TOPPADDING", (0,0), (-1,-1), 2),
+    ("BOTTOMPADDING", (0,0), (-1,-1), 2),
+])
+_EMPTY_ROWS_CACHE = {}
+
 # improved grid function with top-left alignment and reduced padding
 def grid(rows, cols, row_height, col_widths=None):
     if col_widths is None:
-        col_widths = [(A4[0] - 60) / cols] * cols
+        col_widths = [_USABLE_WIDTH / cols] * cols
+
+    # Table copies cell data while normalizing it, so the cached block is never mutated
+    data = _EMPTY_ROWS_CACHE.get((rows, cols))
+    if data is None:
+        data = _EMPTY_ROWS_CACHE[(rows, cols)] = tuple(("",) * cols for _ in range(rows))
 
     tbl = Table(
-        [["" for _ in range(cols)] for _ in range(rows)],
+        data,
         colWidths=col_widths,
         rowHeights=[row_height] * rows
     )
 
-    tbl.setStyle(TableStyle([
-        ("GRID", (0,0), (-1,-1), 0.7, colors.black),
-        ("VALIGN", (0,0), (-1,-1), "TOP"),
-        ("LEFTPADDING", (0,0), (-1,-1), 4),
-        ("RIGHTPADDING", (0,0), (-1,-1), 4),
-        ("TOPPADDING", (0,0), (-1,-1), 2),
-        ("BOTTOMPADDING", (0,0), (-1,-1), 2),
-    ]))
+    tbl.setStyle(_GRID_STYLE)
 
     elements.append(tbl)
 
 def pct_cols(*pcts):
-    usable = A4[0] - 60
-    return [usable * p for p in pcts]
+    return list(_pct_cols_cached(pcts))
+
+@lru_cache(maxsize=64)
+def _pct_cols_cached(pcts):
+    return tuple(_USABLE_WIDTH * p for p in pcts)
 
 
 